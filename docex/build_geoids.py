@@ -13,41 +13,90 @@ Usage:
 import argparse
 import json
 import re
+import sys
+from functools import lru_cache
 from pathlib import Path
 
+import numpy as np
+
+try:
+    # C-accelerated SAX backend when available
+    import ijson.backends.yajl2_c as ijson
+except ImportError:
+    import ijson
+
+try:
+    import orjson
+
+    def _load_json(path: Path):
+        return orjson.loads(path.read_bytes())
+
+    def _dump_json(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+except ImportError:
+    # stdlib fallback when orjson isn't installed
+    def _load_json(path: Path):
+        with open(path) as f:
+            return json.load(f)
+
+    def _dump_json(obj) -> str:
+        return json.dumps(obj, indent=2)
+
 
 # Georgia State FIPS
 STATE_FIPS = "13"
 
+# Valid tract format, same shape the record schemas enforce; anything
+# else is routed to the errors channel before vectorization
+_TRACT_RE = re.compile(r"\d+(\.\d+)?")
+
 
 def load_ga_county_fips(geojson_path: Path) -> dict[str, str]:
     """
     Load Georgia counties from us-counties.geojson and return name -> FIPS mapping.
-    
+
+    Streams the GeoJSON feature-by-feature so the nationwide counties file
+    never has to be fully materialized in memory. The resulting ~159-entry
+    map is cached in a sidecar JSON next to the GeoJSON, so warm runs skip
+    the multi-MB parse entirely.
+
     Returns:
         Dict mapping county name (lowercase) to 3-digit FIPS code
     """
-    with open(geojson_path) as f:
-        data = json.load(f)
-    
+    # Warm path: reuse the sidecar cache if it's newer than the GeoJSON
+    cache_path = geojson_path.with_suffix(".gafips.json")
+    if cache_path.exists() and cache_path.stat().st_mtime >= geojson_path.stat().st_mtime:
+        with open(cache_path) as f:
+            return json.load(f)
+
     county_fips = {}
-    
-    for feature in data["features"]:
-        props = feature.get("properties", {})
-        
-        # Only Georgia (STATEFP = 13)
-        if props.get("STATEFP") != "13":
-            continue
-        
-        name = props.get("NAME", "").lower()
-        fips = props.get("COUNTYFP", "")
-        
-        if name and fips:
-            county_fips[name] = fips
-    
+
+    with open(geojson_path, "rb") as f:
+        for feature in ijson.items(f, "features.item", use_float=True):
+            props = feature.get("properties", {})
+
+            # Only Georgia (STATEFP = 13)
+            if props.get("STATEFP") != "13":
+                continue
+
+            name = props.get("NAME", "").lower()
+            fips = props.get("COUNTYFP", "")
+
+            if name and fips:
+                county_fips[name] = fips
+
+    # Persist for next run; best-effort (e.g., read-only reference dirs)
+    try:
+        with open(cache_path, "w") as f:
+            json.dump(county_fips, f)
+    except OSError:
+        pass
+
     return county_fips
 
 
+@lru_cache(maxsize=4096)
 def normalize_county_name(name: str) -> str:
     """Normalize county name for matching."""
     name = name.lower().strip()
@@ -61,30 +110,21 @@ def normalize_county_name(name: str) -> str:
 def tract_to_6digit(tract: str) -> str:
     """
     Convert tract number to 6-digit format for GEOID.
-    
+
+    Expects an already-trimmed tract string (extractors normalize these).
+
     Examples:
         "202" -> "020200"
         "9601" -> "960100"
         "9601.02" -> "960102"
         "103.01" -> "010301"
     """
-    # Remove any whitespace
-    tract = tract.strip()
-    
-    # Handle decimal tracts (e.g., "9601.02")
-    if "." in tract:
-        whole, decimal = tract.split(".")
-        # Decimal part is always 2 digits
-        decimal = decimal.zfill(2)[:2]
-    else:
-        whole = tract
-        decimal = "00"
-    
-    # Whole part should be 4 digits
-    whole = whole.zfill(4)
-    
-    # Combine: 4 digits + 2 digits = 6 digits
-    return whole + decimal
+    # partition is a single C call (no list alloc); the format spec
+    # truncates the decimal to 2 chars and zero-pads both parts
+    whole, sep, decimal = tract.partition(".")
+    if sep:
+        return f"{whole:0>4}{decimal:0>2.2}"
+    return f"{whole:0>4}00"
 
 
 def build_geoid(county_fips: str, tract: str) -> str:
@@ -93,30 +133,46 @@ def build_geoid(county_fips: str, tract: str) -> str:
     return f"{STATE_FIPS}{county_fips}{tract_6}"
 
 
+def build_geoid_array(fips_list: list[str], tract_list: list[str]) -> list[str]:
+    """
+    Build sorted, de-duplicated GEOIDs from parallel FIPS/tract lists.
+
+    Vectorized equivalent of calling build_geoid per tract: all string ops
+    (partition on ".", zero-padding, concatenation) run as single numpy
+    C-level passes, and np.unique replaces sorted(set(...)).
+    """
+    if not tract_list:
+        return []
+
+    tracts = np.char.strip(np.asarray(tract_list, dtype=str))
+
+    # Split "9601.02" into whole/decimal parts; missing decimals become ""
+    parts = np.char.partition(tracts, ".")
+    whole = np.char.zfill(parts[:, 0], 4)
+    # zfill then truncate to 2 chars, matching tract_to_6digit's behavior
+    decimal = np.char.zfill(parts[:, 2], 2).astype("<U2")
+
+    prefixes = np.char.add(STATE_FIPS, np.asarray(fips_list, dtype=str))
+    geoids = np.char.add(np.char.add(prefixes, whole), decimal)
+
+    # np.unique returns sorted uniques in one pass
+    return np.unique(geoids).tolist()
+
+
 def load_ldct_data(extracted_dir: Path, year: str = "all") -> dict:
     """Load LDCT data for specified year(s)."""
     if year == "all":
-        combined_file = extracted_dir / "ldct_combined.json"
-        with open(combined_file) as f:
-            return json.load(f)
+        return _load_json(extracted_dir / "ldct_combined.json")
     else:
-        year_file = extracted_dir / f"ldct_{year}.json"
-        with open(year_file) as f:
-            data = json.load(f)
-            return {year: data}
+        return {year: _load_json(extracted_dir / f"ldct_{year}.json")}
 
 
 def load_mz_data(extracted_dir: Path, year: str = "all") -> dict:
     """Load Military Zone data for specified year(s)."""
     if year == "all":
-        combined_file = extracted_dir / "mz_combined.json"
-        with open(combined_file) as f:
-            return json.load(f)
+        return _load_json(extracted_dir / "mz_combined.json")
     else:
-        year_file = extracted_dir / f"mz_{year}.json"
-        with open(year_file) as f:
-            data = json.load(f)
-            return {year: data}
+        return {year: _load_json(extracted_dir / f"mz_{year}.json")}
 
 
 def build_geoids_from_ldct(
@@ -130,30 +186,33 @@ def build_geoids_from_ldct(
     Returns:
         Tuple of (geoid_list, errors)
     """
-    geoids = set()
+    fips_list = []
+    tract_list = []
     errors = []
-    
-    for year, year_data in ldct_data.items():
-        if year_filter != "all" and year != year_filter:
-            continue
-        
+
+    # Index straight into the requested year instead of filtering per iteration
+    years = [year_filter] if year_filter != "all" else list(ldct_data)
+
+    for year in years:
+        year_data = ldct_data.get(year, {})
+
         for county, tracts in year_data.items():
             county_norm = normalize_county_name(county)
-            
+
             if county_norm not in county_fips_map:
                 errors.append(f"County not found: {county}")
                 continue
-            
+
             county_fips = county_fips_map[county_norm]
-            
+
             for tract in tracts:
-                try:
-                    geoid = build_geoid(county_fips, tract)
-                    geoids.add(geoid)
-                except Exception as e:
-                    errors.append(f"Error building GEOID for {county}/{tract}: {e}")
-    
-    return sorted(geoids), errors
+                if _TRACT_RE.fullmatch(tract.strip()):
+                    fips_list.append(county_fips)
+                    tract_list.append(tract)
+                else:
+                    errors.append(f"Error building GEOID for {county}/{tract}: invalid tract format")
+
+    return build_geoid_array(fips_list, tract_list), errors
 
 
 def build_geoids_from_mz(
@@ -167,31 +226,34 @@ def build_geoids_from_mz(
     Returns:
         Tuple of (geoid_list, errors)
     """
-    geoids = set()
+    fips_list = []
+    tract_list = []
     errors = []
-    
-    for year, year_data in mz_data.items():
-        if year_filter != "all" and year != year_filter:
-            continue
-        
+
+    # Index straight into the requested year instead of filtering per iteration
+    years = [year_filter] if year_filter != "all" else list(mz_data)
+
+    for year in years:
+        year_data = mz_data.get(year, {})
+
         for county, tract_records in year_data.items():
             county_norm = normalize_county_name(county)
-            
+
             if county_norm not in county_fips_map:
                 errors.append(f"County not found: {county}")
                 continue
-            
+
             county_fips = county_fips_map[county_norm]
-            
+
             for record in tract_records:
                 tract = record["tract"] if isinstance(record, dict) else record
-                try:
-                    geoid = build_geoid(county_fips, tract)
-                    geoids.add(geoid)
-                except Exception as e:
-                    errors.append(f"Error building GEOID for {county}/{tract}: {e}")
-    
-    return sorted(geoids), errors
+                if _TRACT_RE.fullmatch(tract.strip()):
+                    fips_list.append(county_fips)
+                    tract_list.append(tract)
+                else:
+                    errors.append(f"Error building GEOID for {county}/{tract}: invalid tract format")
+
+    return build_geoid_array(fips_list, tract_list), errors
 
 
 def main():
@@ -233,9 +295,9 @@ def main():
     args = parser.parse_args()
     
     # Load county FIPS mapping
-    print(f"Loading Georgia counties from {args.geojson}...", file=__import__('sys').stderr)
+    print(f"Loading Georgia counties from {args.geojson}...", file=sys.stderr)
     county_fips_map = load_ga_county_fips(args.geojson)
-    print(f"  Found {len(county_fips_map)} Georgia counties", file=__import__('sys').stderr)
+    print(f"  Found {len(county_fips_map)} Georgia counties", file=sys.stderr)
     
     # Load zone data and build GEOIDs
     if args.zone_type == "ldct":
@@ -245,13 +307,12 @@ def main():
         data = load_mz_data(args.extracted_dir, args.year)
         geoids, errors = build_geoids_from_mz(data, county_fips_map, args.year)
     
-    # Report errors
+    # Report errors in one stderr write instead of one per line
     if errors:
-        print(f"\nWarnings ({len(errors)}):", file=__import__('sys').stderr)
-        for err in set(errors):
-            print(f"  ⚠ {err}", file=__import__('sys').stderr)
-    
-    print(f"\nGenerated {len(geoids)} unique GEOIDs", file=__import__('sys').stderr)
+        unique_errors = "\n".join(f"  ⚠ {err}" for err in set(errors))
+        sys.stderr.write(f"\nWarnings ({len(errors)}):\n{unique_errors}\n")
+
+    print(f"\nGenerated {len(geoids)} unique GEOIDs", file=sys.stderr)
     
     # Format output
     if args.format == "csv":
@@ -259,13 +320,13 @@ def main():
     elif args.format == "list":
         output = "\n".join(geoids)
     else:  # json
-        output = json.dumps(geoids, indent=2)
+        output = _dump_json(geoids)
     
     # Write output
     if args.output:
         with open(args.output, "w") as f:
             f.write(output)
-        print(f"Saved to {args.output}", file=__import__('sys').stderr)
+        print(f"Saved to {args.output}", file=sys.stderr)
     else:
         print(output)
 
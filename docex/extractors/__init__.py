@@ -2,9 +2,34 @@
 PDF extractors for different zone types.
 """
 
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+
 from .ldct import LDCTExtractor
 from .military_zone import MilitaryZoneExtractor
 from .opportunity_zone import OpportunityZoneExtractor
 
-__all__ = ["LDCTExtractor", "MilitaryZoneExtractor", "OpportunityZoneExtractor"]
+__all__ = ["LDCTExtractor", "MilitaryZoneExtractor", "OpportunityZoneExtractor", "extract_many"]
+
+
+def _extract_one(cls, path: str | Path, **kwargs):
+    """Worker: run a fresh extractor of the given class over one file."""
+    return cls().extract(path, **kwargs)
+
+
+def extract_many(cls, paths, workers: int | None = None, **kwargs) -> list:
+    """
+    Extract several PDFs in parallel, one extractor process per file.
+
+    Args:
+        cls: Extractor class (e.g., LDCTExtractor)
+        paths: PDF paths to process
+        workers: Max worker processes (default: one per core)
+        **kwargs: Extra keyword arguments passed to extract()
 
+    Returns:
+        List of per-file record lists, in the same order as paths
+    """
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        return list(ex.map(partial(_extract_one, cls, **kwargs), paths))
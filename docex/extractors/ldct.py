@@ -11,51 +11,154 @@ Supports both digital PDFs and scanned/image PDFs (via OCR).
 """
 
 import re
+from collections import defaultdict
+from dataclasses import asdict
+from functools import lru_cache
 from pathlib import Path
-from dataclasses import dataclass
 
 import fitz  # PyMuPDF
+import numpy as np
 
 from ..schema.ldct import LDCTRecord
 from ..utils.ocr import is_scanned_pdf, ocr_pdf, ocr_pdf_by_columns
+from ..utils.pdf import open_pdf
 
 
-@dataclass
-class TextSpan:
-    """A text span with position information."""
-    text: str
-    x: float
-    y: float
-    page: int
+@lru_cache(maxsize=None)
+def _tract_sort_key(tract: str) -> tuple[int, int]:
+    """Numeric sort key for tract strings like "202" or "9601.02".
+
+    Cached because the same tract string recurs across years; tuple-of-int
+    comparisons are a single C op during sorting.
+    """
+    whole, _, decimal = tract.partition(".")
+    return (int(whole), int(decimal) if decimal else 0)
+
+
+# Known Georgia MSA names (partial matches ok)
+KNOWN_MSAS = {
+    "ALBANY": "ALBANY",
+    "ATHENS": "ATHENS-CLARK",
+    "ATLANTA": "ATLANTA-SANDY SPRINGS-ROSWELL",
+    "AUGUSTA": "AUGUSTA-RICHMOND",
+    "BRUNSWICK": "BRUNSWICK",
+    "COLUMBUS": "COLUMBUS",
+    "DALTON": "DALTON",
+    "GAINESVILLE": "GAINESVILLE",
+    "HINESVILLE": "HINESVILLE",
+    "MACON": "MACON",
+    "ROME": "ROME",
+    "SAVANNAH": "SAVANNAH",
+    "VALDOSTA": "VALDOSTA",
+    "WARNER": "WARNER ROBINS",
+}
+
+# Single alternation over all known MSA prefixes: one linear scan
+# per span instead of 14 separate substring checks
+MSA_PATTERN = re.compile("|".join(re.escape(prefix) for prefix in KNOWN_MSAS))
+
+# Pattern for census tracts
+TRACT_PATTERN = re.compile(r"Census Tract\s+(\d+(?:\.\d+)?)", re.IGNORECASE)
+
+# Pattern for "(cont.)" suffix
+CONT_PATTERN = re.compile(r"\s*\(cont\.?\)\s*$", re.IGNORECASE)
+
+# Headers/footers to skip in OCR text, folded into one alternation
+SKIP_PATTERN = re.compile(r"Page.*of|Appendix|Less Developed|Annual Census|O\.C\.G\.A")
+
+# Common OCR corrections for county names
+COUNTY_CORRECTIONS = {
+    "dekalb cer": "DeKalb",
+    "dekalb": "DeKalb",
+    "mcintosh": "McIntosh",
+    "mcduffie": "McDuffie",
+    "aker": "Baker",  # OCR cut-off
+}
+
+# A county candidate is 1-2 capitalized words
+COUNTY_NAME_PATTERN = re.compile(r"^[A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+)?$")
+
+# Substrings that disqualify a line from being a county name
+BANNED_PATTERN = re.compile(
+    r"census tract|Less Developed|Annual Census|O\.C\.G\.A|MSA", re.IGNORECASE
+)
+
+# Wrapped fragments of long MSA names that look like county words
+BANNED_EXACT = frozenset({"SPRINGS-ROSWELL", "SPRINGS", "ROSWELL"})
+
+
+@lru_cache(maxsize=4096)
+def _classify_msa_header(text_upper: str) -> str | None:
+    """
+    Classify an uppercased, stripped line as an MSA header.
+
+    Pure and memoized: the same headers repeat across pages and columns,
+    so repeat lines become one dict lookup.
+    """
+    text_upper = CONT_PATTERN.sub("", text_upper)
+
+    # Check against known MSA prefixes
+    match = MSA_PATTERN.search(text_upper)
+    if match:
+        return KNOWN_MSAS[match.group(0)]
+
+    # Check if ends with MSA
+    if text_upper.endswith("MSA"):
+        return text_upper[:-3].strip().rstrip("-").strip()
+
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _classify_county_name(text: str) -> str | None:
+    """
+    Classify a stripped line as a county name.
+
+    Pure and memoized: county names repeat once per tract, so only the
+    first occurrence pays the full rule evaluation.
+    """
+    # Remove (cont.) suffix
+    text = CONT_PATTERN.sub("", text)
+
+    # Apply OCR corrections
+    text_lower = text.lower()
+    if text_lower in COUNTY_CORRECTIONS:
+        return COUNTY_CORRECTIONS[text_lower]
+
+    # Check for partial matches in corrections (e.g., "Dekalb Cer" contains "dekalb")
+    for wrong, correct in COUNTY_CORRECTIONS.items():
+        if wrong in text_lower:
+            return correct
+
+    # Skip tract lines, headers, and MSA fragments in one scan each
+    if BANNED_PATTERN.search(text) or text.upper() in BANNED_EXACT:
+        return None
+
+    # Skip page info
+    if text.isdigit() or text.startswith("Page"):
+        return None
+
+    # 1-2 capitalized words, letters only
+    if COUNTY_NAME_PATTERN.match(text):
+        return text.title()
+
+    return None
 
 
 class LDCTExtractor:
     """Extract Less Developed Census Tract data from PDFs."""
-    
-    # Known Georgia MSA names (partial matches ok)
-    KNOWN_MSAS = {
-        "ALBANY": "ALBANY",
-        "ATHENS": "ATHENS-CLARK",
-        "ATLANTA": "ATLANTA-SANDY SPRINGS-ROSWELL",
-        "AUGUSTA": "AUGUSTA-RICHMOND",
-        "BRUNSWICK": "BRUNSWICK",
-        "COLUMBUS": "COLUMBUS",
-        "DALTON": "DALTON",
-        "GAINESVILLE": "GAINESVILLE",
-        "HINESVILLE": "HINESVILLE",
-        "MACON": "MACON",
-        "ROME": "ROME",
-        "SAVANNAH": "SAVANNAH",
-        "VALDOSTA": "VALDOSTA",
-        "WARNER": "WARNER ROBINS",
-    }
-    
-    # Pattern for census tracts
-    TRACT_PATTERN = re.compile(r"Census Tract\s+(\d+(?:\.\d+)?)", re.IGNORECASE)
-    
-    # Pattern for "(cont.)" suffix
-    CONT_PATTERN = re.compile(r"\s*\(cont\.?\)\s*$", re.IGNORECASE)
-    
+
+    # Module-level tables/patterns, re-exported for callers
+    KNOWN_MSAS = KNOWN_MSAS
+    MSA_PATTERN = MSA_PATTERN
+    TRACT_PATTERN = TRACT_PATTERN
+    CONT_PATTERN = CONT_PATTERN
+    SKIP_PATTERN = SKIP_PATTERN
+    COUNTY_CORRECTIONS = COUNTY_CORRECTIONS
+    COUNTY_NAME_PATTERN = COUNTY_NAME_PATTERN
+    BANNED_PATTERN = BANNED_PATTERN
+    BANNED_EXACT = BANNED_EXACT
+
     def __init__(self):
         self.records: list[LDCTRecord] = []
     
@@ -67,135 +170,94 @@ class LDCTExtractor:
             return int(match.group())
         raise ValueError(f"Could not extract year from filename: {filepath.name}")
     
-    def extract_text_spans(self, doc: fitz.Document) -> list[TextSpan]:
-        """Extract all text spans with positions from the document."""
-        spans = []
-        
+    def iter_page_spans(self, doc: fitz.Document):
+        """
+        Yield one page of text spans at a time in structure-of-arrays form.
+
+        Generates (page_num, texts, xs, ys) tuples — a list of strings plus
+        contiguous coordinate arrays — so callers can process and discard
+        each page instead of materializing every span in the document.
+        """
         for page_num in range(len(doc)):
             page = doc[page_num]
-            text_dict = page.get_text("dict")
-            
-            for block in text_dict.get("blocks", []):
-                if block.get("type") != 0:  # Skip non-text blocks
-                    continue
-                
-                for line in block.get("lines", []):
-                    for span in line.get("spans", []):
-                        x = span["bbox"][0]
-                        y = span["bbox"][1]
-                        text = span.get("text", "").strip()
-                        
-                        if text:
-                            spans.append(TextSpan(
-                                text=text,
-                                x=x,
-                                y=y,
-                                page=page_num
-                            ))
-        
-        return spans
-    
-    def detect_columns(self, spans: list[TextSpan]) -> list[float]:
-        """Detect column x-positions from text spans."""
-        from collections import Counter
-        
-        # Round x-coords and count occurrences
-        x_counts = Counter(round(s.x / 10) * 10 for s in spans)
-        
-        # Find significant column positions (more than 5 items)
-        columns = sorted([x for x, count in x_counts.items() if count > 5])
-        
+
+            texts: list[str] = []
+            xs: list[float] = []
+            ys: list[float] = []
+
+            # "words" returns flat (x0, y0, x1, y1, word, block, line, word)
+            # tuples — far cheaper than the nested dicts of get_text("dict").
+            # Words sharing a (block, line) are re-joined so multi-word cells
+            # like "Ben Hill" stay intact.
+            prev_key = None
+            for x0, y0, _x1, _y1, word, block_no, line_no, _word_no in page.get_text("words"):
+                key = (block_no, line_no)
+
+                if key == prev_key:
+                    texts[-1] = f"{texts[-1]} {word}"
+                else:
+                    texts.append(word)
+                    xs.append(x0)
+                    ys.append(y0)
+                    prev_key = key
+
+            yield (
+                page_num,
+                texts,
+                np.asarray(xs, dtype=np.float64),
+                np.asarray(ys, dtype=np.float64),
+            )
+
+    def detect_columns(self, xs: np.ndarray) -> list[float]:
+        """Detect column x-positions from span x-coordinates."""
+        if len(xs) == 0:
+            return []
+
+        # Histogram x-coords into 10-unit bins in one vectorized pass
+        bins = np.rint(xs / 10).astype(np.int64)
+        counts = np.bincount(bins)
+
+        # Find significant column positions (more than 5 items);
+        # flatnonzero returns them already sorted
+        columns = (np.flatnonzero(counts > 5) * 10).tolist()
+
         # Merge columns that are too close (within 30 units)
         merged = []
         for x in columns:
             if not merged or x - merged[-1] > 30:
                 merged.append(x)
-        
+
         return merged
     
-    def assign_to_column(self, x: float, columns: list[float]) -> int:
-        """Assign an x-coordinate to the nearest column index."""
-        min_dist = float("inf")
-        best_col = 0
-        for i, col_x in enumerate(columns):
-            dist = abs(x - col_x)
-            if dist < min_dist:
-                min_dist = dist
-                best_col = i
-        return best_col
-    
-    def is_msa_header(self, text: str) -> str | None:
-        """Check if text is an MSA header, return normalized MSA name or None."""
-        text = text.strip()
-        text_upper = text.upper()
-        
-        # Remove (cont.) suffix
-        text_upper = self.CONT_PATTERN.sub("", text_upper)
-        
-        # Check against known MSA prefixes
-        for prefix, full_name in self.KNOWN_MSAS.items():
-            if prefix in text_upper:
-                return full_name
-        
-        # Check if ends with MSA
-        if text_upper.endswith("MSA"):
-            return text_upper[:-3].strip().rstrip("-").strip()
-        
-        return None
-    
-    # Common OCR corrections for county names
-    COUNTY_CORRECTIONS = {
-        "dekalb cer": "DeKalb",
-        "dekalb": "DeKalb",
-        "mcintosh": "McIntosh",
-        "mcduffie": "McDuffie",
-        "aker": "Baker",  # OCR cut-off
-    }
+    def assign_to_column(self, xs: np.ndarray, columns: list[float]) -> np.ndarray:
+        """
+        Assign x-coordinates to their nearest column index, vectorized.
+
+        Columns are sorted, so nearest-column assignment is a searchsorted
+        against the midpoints between adjacent columns — O(N log K) in C
+        instead of an O(N*K) Python scan.
+        """
+        if len(columns) < 2:
+            return np.zeros(len(xs), dtype=np.int64)
+
+        cols_arr = np.asarray(columns, dtype=np.float64)
+        midpoints = (cols_arr[:-1] + cols_arr[1:]) / 2
+        return np.searchsorted(midpoints, xs)
     
+    def is_msa_header(self, text: str, text_upper: str | None = None) -> str | None:
+        """
+        Check if text is an MSA header, return normalized MSA name or None.
+
+        Callers iterating many lines can pass the uppercased (stripped) text
+        to avoid recomputing it here.
+        """
+        if text_upper is None:
+            text_upper = text.strip().upper()
+        return _classify_msa_header(text_upper)
+
     def is_county_name(self, text: str) -> str | None:
         """Check if text is a county name, return normalized name or None."""
-        text = text.strip()
-        
-        # Remove (cont.) suffix
-        text = self.CONT_PATTERN.sub("", text)
-        
-        # Apply OCR corrections
-        text_lower = text.lower()
-        if text_lower in self.COUNTY_CORRECTIONS:
-            return self.COUNTY_CORRECTIONS[text_lower]
-        
-        # Check for partial matches in corrections (e.g., "Dekalb Cer" contains "dekalb")
-        for wrong, correct in self.COUNTY_CORRECTIONS.items():
-            if wrong in text_lower:
-                return correct
-        
-        # Skip if it's a tract
-        if "census tract" in text.lower():
-            return None
-        
-        # Skip if it's page info or header
-        if text.isdigit() or text.startswith("Page"):
-            return None
-        if "Less Developed" in text or "Annual Census" in text or "O.C.G.A" in text:
-            return None
-        if "MSA" in text.upper():
-            return None
-        if text.upper() in ["SPRINGS-ROSWELL", "SPRINGS", "ROSWELL"]:
-            return None
-        
-        # Should be 1-2 words, start with uppercase
-        words = text.split()
-        if len(words) > 2:
-            return None
-        
-        if not text or not text[0].isupper():
-            return None
-        
-        # Must be mostly letters
-        if re.match(r"^[A-Z][a-zA-Z\s]+$", text):
-            return text.title()
-        
-        return None
+        return _classify_county_name(text.strip())
     
     def extract_from_ocr_column(self, text: str, year: int, current_msa: str | None = None) -> tuple[list[LDCTRecord], str | None]:
         """
@@ -218,28 +280,22 @@ class LDCTExtractor:
             line = line.strip()
             if not line:
                 continue
-            
+
             # Skip headers and footers
-            if "Page" in line and "of" in line:
-                continue
-            if "Appendix" in line:
-                continue
-            if "Less Developed" in line or "Annual Census" in line:
-                continue
-            if "O.C.G.A" in line:
+            if SKIP_PATTERN.search(line):
                 continue
             if line.startswith("20") and "Census" not in line:
                 continue
-            
+
             # Check for MSA header
-            msa = self.is_msa_header(line)
+            msa = self.is_msa_header(line, text_upper=line.upper())
             if msa:
                 current_msa = msa
                 current_county = None
                 continue
             
             # Check for census tract
-            tract_match = self.TRACT_PATTERN.search(line)
+            tract_match = TRACT_PATTERN.search(line)
             if tract_match:
                 tract = tract_match.group(1)
                 if current_msa and current_county:
@@ -272,16 +328,21 @@ class LDCTExtractor:
         """
         filepath = Path(filepath)
         year = self.extract_year_from_filename(filepath)
-        
+
+        # Open once; the scanned-PDF check reuses this handle instead of
+        # re-parsing the file
+        doc = open_pdf(filepath)
+
         # Check if we need OCR
         if use_ocr is None:
-            use_ocr = is_scanned_pdf(filepath)
-        
+            use_ocr = is_scanned_pdf(doc)
+
         if use_ocr:
             print(f"  Using OCR for scanned PDF (column-aware)...")
-            
-            # First, get full-page OCR to extract MSA headers
-            pages_text = ocr_pdf(filepath, dpi=150)
+
+            # First, get full-page OCR to extract MSA headers; the OCR
+            # helpers render from the already-open document
+            pages_text = ocr_pdf(doc, dpi=150)
             
             # Extract MSA sequence from full pages
             page_msas = []
@@ -294,7 +355,7 @@ class LDCTExtractor:
                 page_msas.append(msas_in_page)
             
             # Now get column-separated OCR
-            pages_columns = ocr_pdf_by_columns(filepath, num_columns=3, dpi=150)
+            pages_columns = ocr_pdf_by_columns(doc, num_columns=3, dpi=150)
             
             self.records = []
             global_msa = None
@@ -317,133 +378,119 @@ class LDCTExtractor:
                     # Update global MSA if column found one
                     if new_msa and new_msa != global_msa:
                         global_msa = new_msa
-            
+
+            doc.close()
             return self.records
         
-        # Digital PDF - use position-based extraction
-        doc = fitz.open(filepath)
-        spans = self.extract_text_spans(doc)
-        doc.close()
-        
-        # Detect columns
-        columns = self.detect_columns(spans)
-        
-        # Group spans by page and column
-        from collections import defaultdict
-        page_columns = defaultdict(lambda: defaultdict(list))
-        
-        for span in spans:
-            col = self.assign_to_column(span.x, columns)
-            page_columns[span.page][col].append(span)
-        
-        # Sort each column by y-coordinate
-        for page in page_columns:
-            for col in page_columns[page]:
-                page_columns[page][col].sort(key=lambda s: s.y)
-        
+        # Digital PDF - use position-based extraction, one page at a time
+        self.records = []
+
+        # Columns are stable across pages in these layouts, so detect them
+        # from the first couple of pages rather than a whole-document pass
+        sample_xs = []
+        for page_num, _, xs, _ in self.iter_page_spans(doc):
+            sample_xs.append(xs)
+            if page_num >= 1:
+                break
+
+        if not sample_xs:
+            doc.close()
+            return self.records
+
+        columns = self.detect_columns(np.concatenate(sample_xs))
+
         # Track MSA state globally (carries across pages and columns)
         # But county state is per-column
         global_msa = None
-        
-        self.records = []
-        
-        # Process pages in order
-        for page_num in sorted(page_columns.keys()):
-            # Process columns left to right
-            for col_idx in sorted(page_columns[page_num].keys()):
-                col_spans = page_columns[page_num][col_idx]
-                
-                current_msa = global_msa
-                current_county = None
-                
-                for span in col_spans:
-                    text = span.text
-                    
-                    # Check for MSA header
-                    msa = self.is_msa_header(text)
-                    if msa:
-                        current_msa = msa
-                        global_msa = msa
-                        current_county = None  # Reset county on new MSA
-                        continue
-                    
-                    # Check for census tract
-                    tract_match = self.TRACT_PATTERN.search(text)
-                    if tract_match:
-                        tract = tract_match.group(1)
-                        if current_msa and current_county:
-                            try:
-                                record = LDCTRecord(
-                                    year=year,
-                                    msa=current_msa,
-                                    county=current_county,
-                                    tract=tract
-                                )
-                                self.records.append(record)
-                            except ValueError as e:
-                                print(f"Warning: Invalid record - {e}")
-                        continue
-                    
-                    # Check for county name
-                    county = self.is_county_name(text)
-                    if county:
-                        current_county = county
-        
+        current_msa = None
+        current_county = None
+
+        for page_num, texts, xs, ys in self.iter_page_spans(doc):
+            if not texts:
+                continue
+
+            # Assign this page's spans to columns in one vectorized pass,
+            # then order them by (column, y) with a single stable lexsort
+            col_idx = self.assign_to_column(xs, columns)
+            order = np.lexsort((ys, col_idx))
+
+            prev_col = None
+            for i in order:
+                if col_idx[i] != prev_col:
+                    # New column: reset per-column state
+                    prev_col = col_idx[i]
+                    current_msa = global_msa
+                    current_county = None
+
+                text = texts[i]
+
+                # Check for MSA header
+                msa = self.is_msa_header(text)
+                if msa:
+                    current_msa = msa
+                    global_msa = msa
+                    current_county = None  # Reset county on new MSA
+                    continue
+
+                # Check for census tract
+                tract_match = TRACT_PATTERN.search(text)
+                if tract_match:
+                    tract = tract_match.group(1)
+                    if current_msa and current_county:
+                        try:
+                            record = LDCTRecord(
+                                year=year,
+                                msa=current_msa,
+                                county=current_county,
+                                tract=tract
+                            )
+                            self.records.append(record)
+                        except ValueError as e:
+                            print(f"Warning: Invalid record - {e}")
+                    continue
+
+                # Check for county name
+                county = self.is_county_name(text)
+                if county:
+                    current_county = county
+
+        doc.close()
         return self.records
     
     def to_dict(self) -> dict:
         """Convert records to a nested dictionary format: {year: {msa: {county: [tracts]}}}."""
-        result = {}
+        # Accumulate into sets so deduplication is O(1) per tract instead of
+        # an O(n) membership scan against a growing list
+        tmp = defaultdict(lambda: defaultdict(lambda: defaultdict(set)))
         for record in self.records:
-            year_key = str(record.year)
-            if year_key not in result:
-                result[year_key] = {}
-            
-            msa_key = record.msa
-            if msa_key not in result[year_key]:
-                result[year_key][msa_key] = {}
-            
-            county_key = record.county
-            if county_key not in result[year_key][msa_key]:
-                result[year_key][msa_key][county_key] = []
-            
-            if record.tract not in result[year_key][msa_key][county_key]:
-                result[year_key][msa_key][county_key].append(record.tract)
-        
-        # Sort tracts numerically
-        for year in result:
-            for msa in result[year]:
-                for county in result[year][msa]:
-                    result[year][msa][county].sort(
-                        key=lambda x: (float(x.split(".")[0]), float(x.split(".")[-1]) if "." in x else 0)
-                    )
-        
-        return result
-    
+            tmp[str(record.year)][record.msa][record.county].add(record.tract)
+
+        # Convert to plain dicts with numerically sorted tract lists
+        return {
+            year: {
+                msa: {
+                    county: sorted(tracts, key=_tract_sort_key)
+                    for county, tracts in counties.items()
+                }
+                for msa, counties in msas.items()
+            }
+            for year, msas in tmp.items()
+        }
+
     def to_simple_dict(self) -> dict:
         """Convert records to simpler format: {year: {county: [tracts]}}."""
-        result = {}
+        tmp = defaultdict(lambda: defaultdict(set))
         for record in self.records:
-            year_key = str(record.year)
-            if year_key not in result:
-                result[year_key] = {}
-            
-            county_key = record.county
-            if county_key not in result[year_key]:
-                result[year_key][county_key] = []
-            
-            if record.tract not in result[year_key][county_key]:
-                result[year_key][county_key].append(record.tract)
-        
-        # Sort tracts
-        for year in result:
-            for county in result[year]:
-                result[year][county].sort(
-                    key=lambda x: (float(x.split(".")[0]), float(x.split(".")[-1]) if "." in x else 0)
-                )
-        
-        return result
+            tmp[str(record.year)][record.county].add(record.tract)
+
+        return {
+            year: {
+                county: sorted(tracts, key=_tract_sort_key)
+                for county, tracts in counties.items()
+            }
+            for year, counties in tmp.items()
+        }
     
     def to_flat_list(self) -> list[dict]:
         """Convert records to a flat list of dicts."""
-        return [record.model_dump() for record in self.records]
+        return [asdict(record) for record in self.records]
@@ -16,48 +16,98 @@ import re
 from datetime import date
 from pathlib import Path
 
-import fitz  # PyMuPDF
-
 from ..schema.opportunity_zone import OpportunityZoneRecord
+from ..utils.pdf import open_pdf
+
+
+# Header/footer fragments worth skipping; matched in a single pass per line
+SKIP_SUBSTRINGS = (
+    "Updated as of",
+    "STATE OPPORTUNITY ZONE",
+    "O.C.G.A",
+    "Designated Area *",
+    "Date Designated",
+    "Designation Period",
+    "https://",
+    "within or adjacent",
+    "greater as determined",
+    "included within",
+    "has been adopted",
+    "community affairs",
+    "Designations made",
+    "poverty rate",
+    "census block",
+    "displays pervasive",
+)
+
+try:
+    # Aho-Corasick matches all sentinels in one O(len(line)) scan
+    import ahocorasick
+
+    _SKIP_AUTOMATON = ahocorasick.Automaton()
+    for _word in SKIP_SUBSTRINGS:
+        _SKIP_AUTOMATON.add_word(_word, _word)
+    _SKIP_AUTOMATON.make_automaton()
+
+    def _is_skippable(line: str) -> bool:
+        return next(_SKIP_AUTOMATON.iter(line), None) is not None
+
+except ImportError:
+    # Fallback: one compiled alternation instead of per-substring `in` checks
+    _SKIP_PATTERN = re.compile("|".join(re.escape(word) for word in SKIP_SUBSTRINGS))
+
+    def _is_skippable(line: str) -> bool:
+        return _SKIP_PATTERN.search(line) is not None
 
 
 class OpportunityZoneExtractor:
     """Extract State Opportunity Zone data from PDFs."""
     
+    # Keyed by the exact capitalized form dates appear in ("March 5, 2021")
     MONTH_MAP = {
-        "january": 1, "february": 2, "march": 3, "april": 4,
-        "may": 5, "june": 6, "july": 7, "august": 8,
-        "september": 9, "october": 10, "november": 11, "december": 12
+        "January": 1, "February": 2, "March": 3, "April": 4,
+        "May": 5, "June": 6, "July": 7, "August": 8,
+        "September": 9, "October": 10, "November": 11, "December": 12
     }
-    
-    # Date pattern: Month DD, YYYY
-    DATE_PATTERN = re.compile(r"^([A-Z][a-z]+)\s+(\d{1,2}),?\s+(\d{4})$")
-    
+
     # Period pattern: YYYY through YYYY
     PERIOD_PATTERN = re.compile(r"(\d{4})\s+(?:through|though)\s+(\d{4})", re.IGNORECASE)
-    
+
     def __init__(self):
         self.records: list[OpportunityZoneRecord] = []
-    
-    def parse_date(self, date_str: str) -> date | None:
-        """Parse date string like 'March 5, 2021' to date object."""
-        match = self.DATE_PATTERN.match(date_str.strip())
-        if not match:
+
+    @staticmethod
+    def parse_date(date_str: str) -> date | None:
+        """Parse date string like 'March 5, 2021' to date object.
+
+        Called speculatively on most lines, so this avoids the regex engine:
+        split once, look the month up by its exact form, and digit-check the
+        day and year slices.
+        """
+        parts = date_str.split()
+        if len(parts) != 3:
             return None
-        
-        month_name = match.group(1).lower()
-        day = int(match.group(2))
-        year = int(match.group(3))
-        month = self.MONTH_MAP.get(month_name)
-        
+
+        month = OpportunityZoneExtractor.MONTH_MAP.get(parts[0])
         if not month:
             return None
-        
-        return date(year, month, day)
+
+        day_str = parts[1]
+        if day_str.endswith(","):
+            day_str = day_str[:-1]
+        if not (day_str.isdigit() and len(day_str) <= 2):
+            return None
+
+        year_str = parts[2]
+        if not (year_str.isdigit() and len(year_str) == 4):
+            return None
+
+        return date(int(year_str), month, int(day_str))
     
-    def parse_period(self, period_str: str) -> tuple[int, int] | None:
+    @staticmethod
+    def parse_period(period_str: str) -> tuple[int, int] | None:
         """Parse period like '2021 through 2030' to (start_year, end_year)."""
-        match = self.PERIOD_PATTERN.search(period_str)
+        match = OpportunityZoneExtractor.PERIOD_PATTERN.search(period_str)
         if match:
             return int(match.group(1)), int(match.group(2))
         return None
@@ -66,81 +116,75 @@ class OpportunityZoneExtractor:
         """Extract all Opportunity Zone records from a PDF file."""
         filepath = Path(filepath)
         
-        doc = fitz.open(filepath)
+        doc = open_pdf(filepath)
         self.records = []
+
+        # Bind the hot parse probes to locals once; they're called 2-3x per
+        # line below and a local load beats repeated attribute lookup
+        parse_date = self.parse_date
+        parse_period = self.parse_period
         
-        # Collect all lines from all pages
-        all_lines = []
+        # Filter and clean lines page by page — no intermediate all-pages
+        # list, one pass instead of two
+        lines = []
         for page_num in range(len(doc)):
             page = doc[page_num]
-            text = page.get_text()
-            all_lines.extend(text.split("\n"))
-        
+
+            # Iterate text blocks in reading order (y-band, then x) rather
+            # than one glued-together page string
+            blocks = page.get_text("blocks")
+            blocks.sort(key=lambda b: (round(b[1] / 5), b[0]))
+
+            for line in (line for block in blocks for line in block[4].split("\n")):
+                line = line.strip()
+                if not line:
+                    continue
+                # Skip headers and footers
+                if _is_skippable(line):
+                    continue
+                if line.startswith("*"):
+                    continue
+                if line.startswith("Page ") and " of " in line:
+                    continue
+                if "Designated Area" in line and "Date" in line:
+                    continue
+
+                lines.append(line)
+
         doc.close()
         
-        # Filter and clean lines
-        lines = []
-        for line in all_lines:
-            line = line.strip()
-            if not line:
-                continue
-            # Skip headers and footers
-            if "Updated as of" in line:
-                continue
-            if line.startswith("Page ") and " of " in line:
-                continue
-            if "STATE OPPORTUNITY ZONE" in line:
-                continue
-            if "O.C.G.A" in line:
-                continue
-            if "Designated Area" in line and "Date" in line:
-                continue
-            if "Designated Area *" in line or "Date Designated" in line or "Designation Period" in line:
-                continue
-            if line.startswith("*"):
-                continue
-            if "https://" in line:
-                continue
-            if "within or adjacent" in line or "greater as determined" in line:
-                continue
-            if "included within" in line or "has been adopted" in line:
-                continue
-            if "community affairs" in line or "Designations made" in line:
-                continue
-            if "poverty rate" in line or "census block" in line:
-                continue
-            if "displays pervasive" in line:
-                continue
-            
-            lines.append(line)
-        
         # Process lines in groups
         # Pattern: Area (1+ lines), Date (1 line), Period (1-2 lines)
+        num_lines = len(lines)
         i = 0
-        while i < len(lines):
-            # Try to identify what this line is
+        while i < num_lines:
+            # Try to identify what this line is. Cheap first-char dispatch
+            # before the parse probes: date lines start "Upper-lower"
+            # ("March ...") and period lines start with a 4-digit year.
             line = lines[i]
-            
+
             # Check if it's a date
-            date_val = self.parse_date(line)
-            if date_val:
-                i += 1
-                continue
-            
+            if line[:1].isupper() and line[1:2].islower():
+                date_val = parse_date(line)
+                if date_val:
+                    i += 1
+                    continue
+
             # Check if it's a period
-            period = self.parse_period(line)
-            if period:
-                i += 1
-                continue
+            if line[:1].isdigit():
+                period = parse_period(line)
+                if period:
+                    i += 1
+                    continue
             
             # Must be an area name - collect until we find a date
             area_parts = [line]
             j = i + 1
             
-            while j < len(lines):
+            while j < num_lines:
                 next_line = lines[j]
                 # Check if next line is a date
-                if self.parse_date(next_line):
+                if next_line[:1].isupper() and next_line[1:2].islower() and parse_date(next_line):
                     break
                 # Could be continuation of area or partial date line
                 if next_line.startswith("amended") or "and" in next_line.lower():
@@ -148,59 +192,55 @@ class OpportunityZoneExtractor:
                     j += 1
                     continue
                 # Check if it looks like a period start
-                if self.parse_period(next_line):
+                if next_line[:1].isdigit() and parse_period(next_line):
                     break
                 # Otherwise it's part of the area
                 area_parts.append(next_line)
                 j += 1
             
             # Now j points to the date line (hopefully)
-            if j >= len(lines):
+            if j >= num_lines:
                 break
             
             date_line = lines[j]
-            date_val = self.parse_date(date_line)
+            date_val = parse_date(date_line)
             
             if not date_val:
                 # Try combining with next line if it has "and amended"
-                if j + 1 < len(lines) and ("amended" in lines[j].lower() or "and" in lines[j].lower()):
+                date_line_lower = date_line.lower()
+                if j + 1 < num_lines and ("amended" in date_line_lower or "and" in date_line_lower):
                     # Skip this weird date format and try the next line
                     j += 1
-                    if j < len(lines):
+                    if j < num_lines:
                         date_line = lines[j]
-                        date_val = self.parse_date(date_line)
+                        date_val = parse_date(date_line)
             
             if not date_val:
                 i = j + 1
                 continue
             
-            # Now look for period
+            # Now look for period; accumulate candidate lines in a list
+            # instead of rebuilding (and re-scanning) a growing string
             k = j + 1
-            period_str = ""
-            
-            while k < len(lines) and not self.parse_period(period_str):
-                period_str += " " + lines[k]
-                period_str = period_str.strip()
-                
-                # Check if we've gone too far (hit another area)
-                if k + 1 < len(lines):
-                    next_next = lines[k + 1]
-                    if self.parse_date(next_next):
-                        break
-                
-                period = self.parse_period(period_str)
+            period_parts = []
+            period = None
+
+            while k < num_lines:
+                period_parts.append(lines[k])
+                period = parse_period(" ".join(period_parts))
                 if period:
                     break
+
+                # Check if we've gone too far (hit another area)
+                if k + 1 < num_lines and parse_date(lines[k + 1]):
+                    break
+
                 k += 1
-            
-            period = self.parse_period(period_str)
-            
+
             if period:
+                # Whitespace/dash cleanup happens once, in the record itself
                 area = " ".join(area_parts)
-                # Clean up area name
-                area = " ".join(area.split())
-                area = area.replace("–", "-").replace("—", "-")
-                
+
                 try:
                     record = OpportunityZoneRecord(
                         area=area,
@@ -9,7 +9,9 @@ Usage:
 """
 
 import argparse
+import hashlib
 import json
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import date
 
@@ -25,6 +27,103 @@ def json_serial(obj):
     raise TypeError(f"Type {type(obj)} not serializable")
 
 
+try:
+    import orjson
+
+    def _dump_json_bytes(obj) -> bytes:
+        # orjson serializes datetime.date natively; output matches stdlib
+        # indent=2 byte-for-byte for this data
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    def _load_json(path: Path):
+        return orjson.loads(path.read_bytes())
+
+except ImportError:
+    # stdlib fallback when orjson isn't installed
+    def _dump_json_bytes(obj) -> bytes:
+        return json.dumps(obj, indent=2, default=json_serial).encode()
+
+    def _load_json(path: Path):
+        with open(path) as f:
+            return json.load(f)
+
+
+# Per-file workers for the process pool: extraction is CPU-bound and
+# independent per PDF, so files parse in parallel while all JSON writing
+# stays in the parent (no file contention, deterministic combine order).
+# Each worker process reuses one extractor per class — extract() resets
+# per-file state, so nothing leaks between files.
+
+_LDCT_EXTRACTOR = LDCTExtractor()
+_MZ_EXTRACTOR = MilitaryZoneExtractor()
+_OZ_EXTRACTOR = OpportunityZoneExtractor()
+
+
+def _extract_ldct_pdf(pdf_file: Path) -> tuple[int, dict]:
+    # Re-raise worker failures as plain RuntimeErrors: some third-party
+    # exceptions (e.g. TesseractNotFoundError) can't round-trip pickle,
+    # which would kill the pool and abort every still-pending file
+    try:
+        records = _LDCT_EXTRACTOR.extract(pdf_file)
+        return len(records), _LDCT_EXTRACTOR.to_simple_dict() if records else {}
+    except Exception as e:
+        raise RuntimeError(str(e)) from None
+
+
+def _extract_mz_pdf(pdf_file: Path) -> tuple[int, dict]:
+    try:
+        records = _MZ_EXTRACTOR.extract(pdf_file)
+        return len(records), _MZ_EXTRACTOR.to_dict() if records else {}
+    except Exception as e:
+        raise RuntimeError(str(e)) from None
+
+
+def _extract_oz_pdf(pdf_file: Path) -> list[dict]:
+    try:
+        _OZ_EXTRACTOR.extract(pdf_file)
+        return _OZ_EXTRACTOR.to_dict()
+    except Exception as e:
+        raise RuntimeError(str(e)) from None
+
+
+def _submit_with_cache(ex: ProcessPoolExecutor, worker, input_dir: Path, output_dir: Path) -> list:
+    """
+    Submit one worker job per PDF, skipping files whose extraction result is
+    already cached under output_dir/.cache, keyed by SHA-256 of the PDF
+    bytes. Hashing is ~GB/s — negligible next to fitz plus parsing.
+
+    Returns (pdf_file, cache_file, future_or_None) tuples in sorted order;
+    a None future means the cached result should be used.
+    """
+    cache_dir = output_dir / ".cache"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+    jobs = []
+    for pdf_file in sorted(input_dir.glob("*.pdf")):
+        key = hashlib.sha256(pdf_file.read_bytes()).hexdigest()
+        cache_file = cache_dir / f"{key}.json"
+        future = None if cache_file.exists() else ex.submit(worker, pdf_file)
+        jobs.append((pdf_file, cache_file, future))
+
+    return jobs
+
+
+def _job_result(cache_file: Path, future):
+    """Return a job's result, reading or populating the extraction cache."""
+    if future is None:
+        return _load_json(cache_file)
+
+    result = future.result()
+
+    # Best-effort: a read-only output dir shouldn't fail the run
+    try:
+        cache_file.write_bytes(_dump_json_bytes(result))
+    except OSError:
+        pass
+
+    return result
+
+
 def extract_ldct(input_dir: Path, output_dir: Path) -> dict:
     """Extract all LDCT files from a directory."""
     print(f"\n{'='*60}")
@@ -32,44 +131,43 @@ def extract_ldct(input_dir: Path, output_dir: Path) -> dict:
     print(f"{'='*60}")
     
     output_dir.mkdir(parents=True, exist_ok=True)
-    all_records = []
+    total_records = 0
     combined = {}
-    
-    for pdf_file in sorted(input_dir.glob("*.pdf")):
-        print(f"\nProcessing: {pdf_file.name}")
-        
-        extractor = LDCTExtractor()
-        try:
-            records = extractor.extract(pdf_file)
-            print(f"  Extracted {len(records)} records")
-            
-            if records:
-                all_records.extend(records)
-                year_dict = extractor.to_simple_dict()
-                
-                # Save per-year file
-                for year, data in year_dict.items():
-                    year_file = output_dir / f"ldct_{year}.json"
-                    with open(year_file, "w") as f:
-                        json.dump(data, f, indent=2, default=json_serial)
-                    print(f"  Saved: {year_file.name}")
-                    
-                    # Add to combined
-                    combined[year] = data
-            else:
-                print("  WARNING: No records extracted (may be scanned/image PDF)")
-                
-        except Exception as e:
-            print(f"  ERROR: {e}")
+
+    with ProcessPoolExecutor() as ex:
+        jobs = _submit_with_cache(ex, _extract_ldct_pdf, input_dir, output_dir)
+
+        for pdf_file, cache_file, future in jobs:
+            print(f"\nProcessing: {pdf_file.name}")
+
+            try:
+                num_records, year_dict = _job_result(cache_file, future)
+                print(f"  Extracted {num_records} records")
+
+                if num_records:
+                    total_records += num_records
+
+                    # Save per-year file
+                    for year, data in year_dict.items():
+                        year_file = output_dir / f"ldct_{year}.json"
+                        year_file.write_bytes(_dump_json_bytes(data))
+                        print(f"  Saved: {year_file.name}")
+
+                        # Add to combined
+                        combined[year] = data
+                else:
+                    print("  WARNING: No records extracted (may be scanned/image PDF)")
+
+            except Exception as e:
+                print(f"  ERROR: {e}")
     
     # Save combined file
     if combined:
         combined_file = output_dir / "ldct_combined.json"
-        with open(combined_file, "w") as f:
-            json.dump(combined, f, indent=2, default=json_serial)
+        combined_file.write_bytes(_dump_json_bytes(combined))
         print(f"\nSaved combined: {combined_file}")
-    
-    print(f"\nTotal LDCT records: {len(all_records)}")
+
+    print(f"\nTotal LDCT records: {total_records}")
     return combined
 
 
@@ -80,49 +178,48 @@ def extract_mz(input_dir: Path, output_dir: Path) -> dict:
     print(f"{'='*60}")
     
     output_dir.mkdir(parents=True, exist_ok=True)
-    all_records = []
+    total_records = 0
     combined = {}
-    
-    for pdf_file in sorted(input_dir.glob("*.pdf")):
-        print(f"\nProcessing: {pdf_file.name}")
-        
-        extractor = MilitaryZoneExtractor()
-        try:
-            records = extractor.extract(pdf_file)
-            print(f"  Extracted {len(records)} records")
-            
-            if records:
-                all_records.extend(records)
-                year_dict = extractor.to_dict()
-                
-                # Save per-year file
-                for year, data in year_dict.items():
-                    year_file = output_dir / f"mz_{year}.json"
-                    with open(year_file, "w") as f:
-                        json.dump(data, f, indent=2, default=json_serial)
-                    print(f"  Saved: {year_file.name}")
-                    
-                    # Add to combined
-                    if year not in combined:
-                        combined[year] = {}
-                    for county, tracts in data.items():
-                        if county not in combined[year]:
-                            combined[year][county] = []
-                        combined[year][county].extend(tracts)
-            else:
-                print("  WARNING: No records extracted (may be a map visualization)")
-                
-        except Exception as e:
-            print(f"  ERROR: {e}")
+
+    with ProcessPoolExecutor() as ex:
+        jobs = _submit_with_cache(ex, _extract_mz_pdf, input_dir, output_dir)
+
+        for pdf_file, cache_file, future in jobs:
+            print(f"\nProcessing: {pdf_file.name}")
+
+            try:
+                num_records, year_dict = _job_result(cache_file, future)
+                print(f"  Extracted {num_records} records")
+
+                if num_records:
+                    total_records += num_records
+
+                    # Save per-year file
+                    for year, data in year_dict.items():
+                        year_file = output_dir / f"mz_{year}.json"
+                        year_file.write_bytes(_dump_json_bytes(data))
+                        print(f"  Saved: {year_file.name}")
+
+                        # Add to combined
+                        if year not in combined:
+                            combined[year] = {}
+                        for county, tracts in data.items():
+                            if county not in combined[year]:
+                                combined[year][county] = []
+                            combined[year][county].extend(tracts)
+                else:
+                    print("  WARNING: No records extracted (may be a map visualization)")
+
+            except Exception as e:
+                print(f"  ERROR: {e}")
     
     # Save combined file
     if combined:
         combined_file = output_dir / "mz_combined.json"
-        with open(combined_file, "w") as f:
-            json.dump(combined, f, indent=2, default=json_serial)
+        combined_file.write_bytes(_dump_json_bytes(combined))
         print(f"\nSaved combined: {combined_file}")
-    
-    print(f"\nTotal MZ records: {len(all_records)}")
+
+    print(f"\nTotal MZ records: {total_records}")
     return combined
 
 
@@ -134,26 +231,27 @@ def extract_oz(input_dir: Path, output_dir: Path) -> list:
     
     output_dir.mkdir(parents=True, exist_ok=True)
     all_records = []
-    
-    for pdf_file in sorted(input_dir.glob("*.pdf")):
-        print(f"\nProcessing: {pdf_file.name}")
-        
-        extractor = OpportunityZoneExtractor()
-        try:
-            records = extractor.extract(pdf_file)
-            print(f"  Extracted {len(records)} records")
-            
-            if records:
-                all_records.extend(extractor.to_dict())
-                
-        except Exception as e:
-            print(f"  ERROR: {e}")
+
+    with ProcessPoolExecutor() as ex:
+        jobs = _submit_with_cache(ex, _extract_oz_pdf, input_dir, output_dir)
+
+        for pdf_file, cache_file, future in jobs:
+            print(f"\nProcessing: {pdf_file.name}")
+
+            try:
+                records = _job_result(cache_file, future)
+                print(f"  Extracted {len(records)} records")
+
+                if records:
+                    all_records.extend(records)
+
+            except Exception as e:
+                print(f"  ERROR: {e}")
     
     # Save output
     if all_records:
         output_file = output_dir / "opportunity_zones.json"
-        with open(output_file, "w") as f:
-            json.dump(all_records, f, indent=2, default=json_serial)
+        output_file.write_bytes(_dump_json_bytes(all_records))
         print(f"\nSaved: {output_file}")
     
     print(f"\nTotal OZ records: {len(all_records)}")
@@ -1,5 +1,5 @@
 """
-Pydantic schemas for extracted zone data.
+Record schemas for extracted zone data.
 """
 
 from .ldct import LDCTRecord
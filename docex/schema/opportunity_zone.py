@@ -2,36 +2,36 @@
 Schema for State Opportunity Zone records.
 """
 
+import re
+from dataclasses import dataclass
 from datetime import date
-from pydantic import BaseModel, field_validator
 
+# One C-level pass each: collapse runs of whitespace, then map em/en
+# dashes to plain dashes
+_WS_RE = re.compile(r"\s+")
+_DASH_TABLE = str.maketrans({"–": "-", "—": "-"})
 
-class OpportunityZoneRecord(BaseModel):
+
+@dataclass(slots=True)
+class OpportunityZoneRecord:
     """A single State Opportunity Zone designation."""
-    
+
     area: str
     designated_date: date
     start_year: int
     end_year: int
-    
-    @field_validator("area")
-    @classmethod
-    def normalize_area(cls, v: str) -> str:
-        """Clean up area name."""
-        # Normalize whitespace and dashes
-        v = " ".join(v.split())
-        # Replace em-dashes and en-dashes with regular dashes
-        v = v.replace("–", "-").replace("—", "-")
-        return v.strip()
-    
-    @field_validator("start_year", "end_year")
-    @classmethod
-    def validate_year(cls, v: int) -> int:
-        """Ensure year is reasonable. Fix common typos like 3032 -> 2032."""
-        # Fix typo: 3032 -> 2032, 3033 -> 2033, etc.
-        if 3000 <= v <= 3050:
-            v = v - 1000
-        if not 2000 <= v <= 2050:
-            raise ValueError(f"Year out of range: {v}")
-        return v
 
+    def __post_init__(self):
+        # Normalize whitespace and dashes in the area name
+        self.area = _WS_RE.sub(" ", self.area).translate(_DASH_TABLE).strip()
+
+        # Fix typo years: 3032 -> 2032, 3033 -> 2033, etc.
+        if 3000 <= self.start_year <= 3050:
+            self.start_year -= 1000
+        if 3000 <= self.end_year <= 3050:
+            self.end_year -= 1000
+
+        if not 2000 <= self.start_year <= 2050:
+            raise ValueError(f"Year out of range: {self.start_year}")
+        if not 2000 <= self.end_year <= 2050:
+            raise ValueError(f"Year out of range: {self.end_year}")
@@ -2,57 +2,69 @@
 OCR utilities for processing scanned PDFs.
 """
 
-import io
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import fitz  # PyMuPDF
 
 
-def is_scanned_pdf(filepath: str | Path) -> bool:
-    """Check if a PDF is scanned (image-based) vs digital text."""
-    doc = fitz.open(filepath)
-    
-    # Check first few pages
-    for page_num in range(min(3, len(doc))):
-        page = doc[page_num]
-        text = page.get_text().strip()
-        
-        # If we get substantial text, it's digital
-        if len(text) > 100:
+def is_scanned_pdf(pdf: str | Path | fitz.Document) -> bool:
+    """
+    Check if a PDF is scanned (image-based) vs digital text.
+
+    Accepts a path or an already-open fitz.Document; passing an open
+    document avoids re-parsing the file, and it is left open for the caller.
+    """
+    doc = pdf if isinstance(pdf, fitz.Document) else fitz.open(pdf)
+
+    try:
+        # Check first few pages
+        for page_num in range(min(3, len(doc))):
+            page = doc[page_num]
+            text = page.get_text().strip()
+
+            # If we get substantial text, it's digital
+            if len(text) > 100:
+                return False
+
+        return True
+    finally:
+        if doc is not pdf:
             doc.close()
-            return False
-    
-    doc.close()
-    return True
+
+
+def _pixmap_to_image(pix: fitz.Pixmap):
+    """Wrap rendered samples in a PIL image directly — no PNG encode/decode
+    round-trip between PyMuPDF and Pillow."""
+    from PIL import Image
+
+    mode = "RGBA" if pix.alpha else "RGB"
+    return Image.frombytes(mode, (pix.width, pix.height), pix.samples)
 
 
 def ocr_pdf_page(page: fitz.Page, dpi: int = 150) -> str:
     """
     Run OCR on a single PDF page.
-    
+
     Args:
         page: PyMuPDF page object
         dpi: Resolution for rendering (higher = better OCR but slower)
-    
+
     Returns:
         Extracted text from OCR
     """
     try:
         import pytesseract
-        from PIL import Image
+        from PIL import Image  # noqa: F401 - surfaced in the error message
     except ImportError:
         raise ImportError("OCR requires pytesseract and Pillow: pip install pytesseract pillow")
-    
-    # Render page as image
-    pix = page.get_pixmap(dpi=dpi)
-    
-    # Convert to PIL Image
-    img_data = pix.tobytes("png")
-    img = Image.open(io.BytesIO(img_data))
-    
+
+    # Render page as image and hand the raw pixels to PIL
+    img = _pixmap_to_image(page.get_pixmap(dpi=dpi))
+
     # Run OCR
     text = pytesseract.image_to_string(img)
-    
+
     return text
 
 
@@ -70,17 +82,13 @@ def ocr_pdf_page_columns(page: fitz.Page, num_columns: int = 3, dpi: int = 150)
     """
     try:
         import pytesseract
-        from PIL import Image
+        from PIL import Image  # noqa: F401 - surfaced in the error message
     except ImportError:
         raise ImportError("OCR requires pytesseract and Pillow: pip install pytesseract pillow")
-    
-    # Render page as image
-    pix = page.get_pixmap(dpi=dpi)
-    
-    # Convert to PIL Image
-    img_data = pix.tobytes("png")
-    img = Image.open(io.BytesIO(img_data))
-    
+
+    # Render page as image and hand the raw pixels to PIL
+    img = _pixmap_to_image(page.get_pixmap(dpi=dpi))
+
     width, height = img.size
     col_width = width // num_columns
     
@@ -101,48 +109,98 @@ def ocr_pdf_page_columns(page: fitz.Page, num_columns: int = 3, dpi: int = 150)
     return column_texts
 
 
-def ocr_pdf(filepath: str | Path, dpi: int = 150) -> list[str]:
+def _render_pages(pdf: str | Path | fitz.Document, dpi: int = 150) -> list:
+    """Render every page to a PIL image (PyMuPDF rendering stays serial; it
+    isn't thread-safe per document).
+
+    Like is_scanned_pdf, accepts an already-open fitz.Document and leaves
+    it open for the caller.
+    """
+    doc = pdf if isinstance(pdf, fitz.Document) else fitz.open(pdf)
+    try:
+        return [
+            _pixmap_to_image(doc[page_num].get_pixmap(dpi=dpi))
+            for page_num in range(len(doc))
+        ]
+    finally:
+        if doc is not pdf:
+            doc.close()
+
+
+def ocr_pdf(pdf: str | Path | fitz.Document, dpi: int = 150, workers: int | None = None) -> list[str]:
     """
     Run OCR on all pages of a PDF.
-    
+
+    Pages are OCR'd in parallel across a thread pool — tesseract's C++ core
+    releases the GIL, so threads scale with core count without the pickling
+    and process-spawn overhead of a process pool.
+
     Args:
-        filepath: Path to PDF file
+        pdf: Path to PDF file, or an already-open fitz.Document
         dpi: Resolution for rendering
-    
+        workers: Max worker threads (default: one per core)
+
     Returns:
         List of text strings, one per page
     """
-    doc = fitz.open(filepath)
-    pages_text = []
-    
-    for page_num in range(len(doc)):
-        page = doc[page_num]
-        text = ocr_pdf_page(page, dpi=dpi)
-        pages_text.append(text)
-    
-    doc.close()
-    return pages_text
+    try:
+        import pytesseract
+        from PIL import Image  # noqa: F401 - surfaced in the error message
+    except ImportError:
+        raise ImportError("OCR requires pytesseract and Pillow: pip install pytesseract pillow")
+
+    pages = _render_pages(pdf, dpi=dpi)
+
+    # map preserves page order
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        return list(ex.map(pytesseract.image_to_string, pages))
 
 
-def ocr_pdf_by_columns(filepath: str | Path, num_columns: int = 3, dpi: int = 150) -> list[list[str]]:
+def ocr_pdf_by_columns(
+    pdf: str | Path | fitz.Document,
+    num_columns: int = 3,
+    dpi: int = 150,
+    workers: int | None = None,
+) -> list[list[str]]:
     """
     Run OCR on all pages of a PDF, extracting columns separately.
-    
+
+    Like ocr_pdf, OCR runs on a thread pool; (page, column) crops are
+    flattened into one task list for finer-grained scheduling, then
+    regrouped per page.
+
     Args:
-        filepath: Path to PDF file
+        pdf: Path to PDF file, or an already-open fitz.Document
         num_columns: Number of columns per page
         dpi: Resolution for rendering
-    
+        workers: Max worker threads (default: one per core)
+
     Returns:
         List of pages, each containing a list of column texts
     """
-    doc = fitz.open(filepath)
-    pages_columns = []
-    
-    for page_num in range(len(doc)):
-        page = doc[page_num]
-        columns = ocr_pdf_page_columns(page, num_columns=num_columns, dpi=dpi)
-        pages_columns.append(columns)
-    
-    doc.close()
-    return pages_columns
+    try:
+        import pytesseract
+        from PIL import Image  # noqa: F401 - surfaced in the error message
+    except ImportError:
+        raise ImportError("OCR requires pytesseract and Pillow: pip install pytesseract pillow")
+
+    column_crops = []
+
+    for img in _render_pages(pdf, dpi=dpi):
+        width, height = img.size
+        col_width = width // num_columns
+
+        for i in range(num_columns):
+            # Calculate column boundaries with slight overlap
+            left = max(0, i * col_width - 5)
+            right = min(width, (i + 1) * col_width + 5)
+            column_crops.append(img.crop((left, 0, right, height)))
+
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        texts = list(ex.map(pytesseract.image_to_string, column_crops))
+
+    # Regroup the flat (page, column) results page by page
+    return [
+        texts[start:start + num_columns]
+        for start in range(0, len(texts), num_columns)
+    ]
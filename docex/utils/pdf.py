@@ -0,0 +1,24 @@
+"""
+PDF loading helpers.
+"""
+
+import mmap
+from pathlib import Path
+
+import fitz  # PyMuPDF
+
+
+def open_pdf(filepath: str | Path) -> fitz.Document:
+    """
+    Open a PDF through a read-only memory map.
+
+    fitz parses from the mapped bytes instead of issuing its own reads, so
+    repeated opens of the same file are served straight from the OS page
+    cache, and large PDFs aren't copied into Python memory up front. The
+    mapping is released when the document is garbage-collected after close.
+    """
+    with open(filepath, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    # fitz wants a buffer, not the mmap itself; memoryview stays zero-copy
+    # and keeps the mapping alive for the document's lifetime
+    return fitz.open(stream=memoryview(mapped), filetype="pdf")
@@ -8,9 +8,51 @@ Usage:
 """
 
 import argparse
+import heapq
+import io
 import json
+import re
+import sys
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from functools import partial
+from itertools import islice
 from pathlib import Path
-from collections import defaultdict
+
+# Valid tract format, same shape the record schemas enforce
+_TRACT_RE = re.compile(r"\d+(\.\d+)?")
+
+try:
+    # C-accelerated SAX backend when available
+    import ijson.backends.yajl2_c as ijson
+except ImportError:
+    import ijson
+
+try:
+    import orjson
+
+    def _load_json(path: Path):
+        return orjson.loads(path.read_bytes())
+
+except ImportError:
+    # stdlib fallback when orjson isn't installed
+    def _load_json(path: Path):
+        with open(path) as f:
+            return json.load(f)
+
+
+def _intern_year(year_data: dict) -> dict:
+    """Intern county keys and tract strings in one year's data.
+
+    The same counties and tracts recur across years; interned strings
+    hash once and compare by pointer in all the set and dict operations
+    downstream, and the duplicates share storage.
+    """
+    return {
+        sys.intern(county): [sys.intern(t) for t in tracts]
+        for county, tracts in year_data.items()
+    }
 
 
 def load_ldct_combined(extracted_dir: Path) -> dict:
@@ -18,112 +60,180 @@ def load_ldct_combined(extracted_dir: Path) -> dict:
     combined_file = extracted_dir / "ldct_combined.json"
     if not combined_file.exists():
         raise FileNotFoundError(f"Combined file not found: {combined_file}")
-    
-    with open(combined_file) as f:
-        return json.load(f)
+
+    data = _load_json(combined_file)
+    return {year: _intern_year(year_data) for year, year_data in data.items()}
+
+
+def _normalize_mz_year(year_data: dict) -> dict:
+    """Rebuild one MZ year as interned county -> [tract, ...] strings."""
+    return {
+        sys.intern(county): [sys.intern(t["tract"]) for t in tracts]
+        for county, tracts in year_data.items()
+    }
 
 
 def load_mz_combined(extracted_dir: Path) -> dict:
-    """Load the combined MZ JSON."""
+    """Load the combined MZ JSON, normalized to county -> [tract, ...].
+
+    MZ files store per-tract record dicts; extracting the tract strings
+    here gives every analysis function the same shape as LDCT data, with
+    no per-element type dispatch downstream.
+    """
     combined_file = extracted_dir / "mz_combined.json"
     if not combined_file.exists():
         raise FileNotFoundError(f"Combined file not found: {combined_file}")
-    
-    with open(combined_file) as f:
-        return json.load(f)
 
+    data = _load_json(combined_file)
+    return {year: _normalize_mz_year(year_data) for year, year_data in data.items()}
 
-def summary_stats(data: dict, zone_type: str = "ldct"):
-    """Print summary statistics for extracted data."""
-    print(f"\n{'='*60}")
-    print(f"Summary Statistics - {zone_type.upper()}")
-    print(f"{'='*60}\n")
-    
-    for year in sorted(data.keys()):
-        year_data = data[year]
+
+def iter_years(combined_file: Path):
+    """
+    Stream (year, year_data) pairs from a combined JSON file.
+
+    Parses incrementally with ijson, so single-pass consumers never hold
+    more than one year's data in memory.
+    """
+    if not combined_file.exists():
+        raise FileNotFoundError(f"Combined file not found: {combined_file}")
+
+    with open(combined_file, "rb") as f:
+        yield from ijson.kvitems(f, "")
+
+
+# The analysis checks are written as accumulators with an
+# update(year, year_data)/finalize() protocol, so full mode can feed all
+# of them from one streamed pass over the combined file instead of
+# re-walking the data per check. The plain functions below each class
+# keep the original one-shot call style.
+
+
+class StatsAcc:
+    """Accumulates per-year summary counts; finalize prints the report."""
+
+    def __init__(self, zone_type: str = "ldct"):
+        self.zone_type = zone_type
+        self.per_year = {}
+
+    def update(self, year, year_data):
         counties = len(year_data)
-        
-        if zone_type == "ldct":
-            total_tracts = sum(len(tracts) for tracts in year_data.values())
-        else:  # mz
-            total_tracts = sum(len(tracts) for tracts in year_data.values())
-        
-        print(f"{year}: {counties:3} counties, {total_tracts:4} tracts")
-    
-    print()
+        total_tracts = sum(len(tracts) for tracts in year_data.values())
+        self.per_year[year] = (counties, total_tracts)
+
+    def finalize(self):
+        out = [f"\n{'='*60}", f"Summary Statistics - {self.zone_type.upper()}", f"{'='*60}\n"]
+
+        for year in sorted(self.per_year):
+            counties, total_tracts = self.per_year[year]
+            out.append(f"{year}: {counties:3} counties, {total_tracts:4} tracts")
 
+        out.append("")
+        sys.stdout.write("\n".join(out) + "\n")
 
-def year_over_year_comparison(data: dict, year1: str, year2: str, zone_type: str = "ldct"):
+
+def summary_stats(data, zone_type: str = "ldct"):
+    """Print summary statistics for extracted data.
+
+    Accepts the combined dict or any iterable of (year, year_data) pairs,
+    e.g. the iter_years stream.
+    """
+    acc = StatsAcc(zone_type)
+    for year, year_data in data.items() if isinstance(data, dict) else data:
+        acc.update(year, year_data)
+    acc.finalize()
+
+
+def _precompute_year_sets(data: dict) -> dict:
+    """Build (county_set, tract_sets_by_county) for each year.
+
+    The full command compares every adjacent year pair, so each year's sets
+    are needed twice; building them once halves the set construction.
+    """
+    precomp = {}
+    for year, year_data in data.items():
+        tract_sets = {c: set(ts) for c, ts in year_data.items()}
+        precomp[year] = (set(year_data), tract_sets)
+    return precomp
+
+
+def year_over_year_comparison(data: dict, year1: str, year2: str,
+                              precomp: dict | None = None):
     """Compare two years to find added/removed counties and tracts."""
-    print(f"\n{'='*60}")
-    print(f"Year-over-Year Comparison: {year1} → {year2}")
-    print(f"{'='*60}\n")
-    
+    # Gather report lines and emit them in one stdout write at the end
+    # instead of a syscall per print
+    out = [f"\n{'='*60}", f"Year-over-Year Comparison: {year1} → {year2}", f"{'='*60}\n"]
+
     if year1 not in data:
-        print(f"ERROR: Year {year1} not found")
+        out.append(f"ERROR: Year {year1} not found")
+        sys.stdout.write("\n".join(out) + "\n")
         return
     if year2 not in data:
-        print(f"ERROR: Year {year2} not found")
+        out.append(f"ERROR: Year {year2} not found")
+        sys.stdout.write("\n".join(out) + "\n")
         return
-    
+
     data1 = data[year1]
     data2 = data[year2]
-    
-    counties1 = set(data1.keys())
-    counties2 = set(data2.keys())
-    
+
+    if precomp is None:
+        precomp = _precompute_year_sets({year1: data1, year2: data2})
+    counties1, tract_sets1 = precomp[year1]
+    counties2, tract_sets2 = precomp[year2]
+
     added_counties = counties2 - counties1
     removed_counties = counties1 - counties2
     common_counties = counties1 & counties2
     
-    print(f"Counties in {year1}: {len(counties1)}")
-    print(f"Counties in {year2}: {len(counties2)}")
-    print()
-    
+    out.append(f"Counties in {year1}: {len(counties1)}")
+    out.append(f"Counties in {year2}: {len(counties2)}")
+    out.append("")
+
     if added_counties:
-        print(f"Counties ADDED in {year2}: ({len(added_counties)})")
+        out.append(f"Counties ADDED in {year2}: ({len(added_counties)})")
         for c in sorted(added_counties):
             tracts = data2[c]
-            print(f"  + {c}: {tracts[:5]}{'...' if len(tracts) > 5 else ''}")
-        print()
-    
+            out.append(f"  + {c}: {tracts[:5]}{'...' if len(tracts) > 5 else ''}")
+        out.append("")
+
     if removed_counties:
-        print(f"Counties REMOVED in {year2}: ({len(removed_counties)})")
+        out.append(f"Counties REMOVED in {year2}: ({len(removed_counties)})")
         for c in sorted(removed_counties):
             tracts = data1[c]
-            print(f"  - {c}: {tracts[:5]}{'...' if len(tracts) > 5 else ''}")
-        print()
+            out.append(f"  - {c}: {tracts[:5]}{'...' if len(tracts) > 5 else ''}")
+        out.append("")
     
     # Check tract changes in common counties
     tract_changes = []
     for county in common_counties:
-        if zone_type == "ldct":
-            tracts1 = set(data1[county])
-            tracts2 = set(data2[county])
-        else:
-            tracts1 = set(t["tract"] for t in data1[county])
-            tracts2 = set(t["tract"] for t in data2[county])
-        
-        added = tracts2 - tracts1
-        removed = tracts1 - tracts2
-        
-        if added or removed:
+        tracts1 = tract_sets1[county]
+        tracts2 = tract_sets2[county]
+
+        # One symmetric-difference pass bails out unchanged counties (the
+        # common case) before building the two directional diffs
+        if tracts1 ^ tracts2:
+            added = tracts2 - tracts1
+            removed = tracts1 - tracts2
             tract_changes.append((county, added, removed))
     
     if tract_changes:
-        print(f"Tract changes in existing counties: ({len(tract_changes)} counties)")
-        for county, added, removed in sorted(tract_changes)[:15]:
+        out.append(f"Tract changes in existing counties: ({len(tract_changes)} counties)")
+        # O(n log 15) partial sort; equivalent to sorted(...)[:15]
+        for county, added, removed in heapq.nsmallest(15, tract_changes):
+            # islice takes the 3-element samples without copying the
+            # whole set into a list first
             if added:
-                print(f"  {county}: +{len(added)} tracts ({list(added)[:3]}{'...' if len(added) > 3 else ''})")
+                out.append(f"  {county}: +{len(added)} tracts ({list(islice(added, 3))}{'...' if len(added) > 3 else ''})")
             if removed:
-                print(f"  {county}: -{len(removed)} tracts ({list(removed)[:3]}{'...' if len(removed) > 3 else ''})")
-        
+                out.append(f"  {county}: -{len(removed)} tracts ({list(islice(removed, 3))}{'...' if len(removed) > 3 else ''})")
+
         if len(tract_changes) > 15:
-            print(f"  ... and {len(tract_changes) - 15} more counties with changes")
+            out.append(f"  ... and {len(tract_changes) - 15} more counties with changes")
     else:
-        print("No tract changes in common counties.")
-    
-    print()
+        out.append("No tract changes in common counties.")
+
+    out.append("")
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def spot_check_county(data: dict, county_name: str):
@@ -132,123 +242,166 @@ def spot_check_county(data: dict, county_name: str):
     print(f"Spot Check: {county_name}")
     print(f"{'='*60}\n")
     
-    found = False
-    for year in sorted(data.keys()):
-        # Case-insensitive search
-        for county in data[year]:
-            if county.lower() == county_name.lower():
-                tracts = data[year][county]
-                print(f"{year}: {tracts}")
-                found = True
-                break
-    
-    if not found:
+    # One pass builds a case-insensitive index; lookup and the similar-name
+    # suggestions below then avoid re-folding every county per year.
+    # casefold rather than lower for full Unicode case-insensitivity.
+    index = defaultdict(list)
+    for year, year_data in data.items():
+        for county in year_data:
+            index[county.casefold()].append((year, county))
+
+    target = county_name.casefold()
+    matches = index.get(target)
+
+    if matches:
+        for year, county in sorted(matches):
+            print(f"{year}: {data[year][county]}")
+    else:
         print(f"County '{county_name}' not found in any year.")
         # Suggest similar names
-        all_counties = set()
-        for year_data in data.values():
-            all_counties.update(year_data.keys())
-        
-        similar = [c for c in all_counties if county_name.lower() in c.lower()]
+        similar = sorted({
+            county
+            for lower, entries in index.items() if target in lower
+            for _, county in entries
+        })
         if similar:
             print(f"\nDid you mean: {similar}")
-    
+
     print()
 
 
+class AnomalyAcc:
+    """Accumulates data-quality counters; finalize prints the issues."""
+
+    def __init__(self):
+        self.tract_counts = Counter()  # (year, county, tract) -> occurrences
+        self.group_counts = Counter()  # (year, county) -> tract count
+        self.format_issues = []
+
+    def update(self, year, year_data):
+        for county, tracts in year_data.items():
+            self.tract_counts.update((year, county, tract) for tract in tracts)
+            self.group_counts[(year, county)] += len(tracts)
+            for tract in tracts:
+                if not _TRACT_RE.fullmatch(tract):
+                    self.format_issues.append(f"{year}/{county}: Invalid tract format: {tract}")
+
+    def finalize(self):
+        out = [f"\n{'='*60}", "Anomaly Detection", f"{'='*60}\n"]
+
+        issues = []
+
+        # Duplicate tracts within same county/year
+        dupes_by_group = defaultdict(set)
+        for (year, county, tract), n in self.tract_counts.items():
+            if n > 1:
+                dupes_by_group[(year, county)].add(tract)
+        for (year, county), dupes in dupes_by_group.items():
+            issues.append(f"{year}/{county}: Duplicate tracts: {dupes}")
+
+        # Unusual tract counts (very high or low)
+        if self.group_counts:
+            avg_count = self.group_counts.total() / len(self.group_counts)
+            threshold = avg_count * 3
+            high_outliers = [(y, c, n) for (y, c), n in self.group_counts.items()
+                             if n > threshold]
+
+            if high_outliers:
+                issues.append(f"High tract counts (>3x average of {avg_count:.1f}):")
+                for y, c, n in heapq.nlargest(5, high_outliers, key=lambda x: x[2]):
+                    issues.append(f"  {y}/{c}: {n} tracts")
+
+        # Tract format issues, gathered during update
+        issues.extend(self.format_issues)
+
+        if issues:
+            out.append("Potential issues found:")
+            for issue in issues[:20]:
+                out.append(f"  ⚠ {issue}")
+            if len(issues) > 20:
+                out.append(f"  ... and {len(issues) - 20} more")
+        else:
+            out.append("✓ No anomalies detected")
+
+        out.append("")
+        sys.stdout.write("\n".join(out) + "\n")
+
+
 def find_anomalies(data: dict):
     """Find potential data quality issues."""
-    print(f"\n{'='*60}")
-    print("Anomaly Detection")
-    print(f"{'='*60}\n")
-    
-    issues = []
-    
-    # Check for duplicate tracts within same county/year
-    for year in data:
-        for county, tracts in data[year].items():
-            if isinstance(tracts, list):
-                if len(tracts) != len(set(tracts)):
-                    dupes = [t for t in tracts if tracts.count(t) > 1]
-                    issues.append(f"{year}/{county}: Duplicate tracts: {set(dupes)}")
-    
-    # Check for unusual tract counts (very high or low)
-    all_counts = []
-    for year in data:
-        for county, tracts in data[year].items():
-            count = len(tracts) if isinstance(tracts, list) else len(tracts)
-            all_counts.append((year, county, count))
-    
-    if all_counts:
-        avg_count = sum(c[2] for c in all_counts) / len(all_counts)
-        high_outliers = [(y, c, n) for y, c, n in all_counts if n > avg_count * 3]
-        
-        if high_outliers:
-            issues.append(f"High tract counts (>3x average of {avg_count:.1f}):")
-            for y, c, n in sorted(high_outliers, key=lambda x: -x[2])[:5]:
-                issues.append(f"  {y}/{c}: {n} tracts")
-    
-    # Check for tract format issues
-    for year in data:
-        for county, tracts in data[year].items():
-            if isinstance(tracts, list):
-                for tract in tracts:
-                    if not tract.replace(".", "").isdigit():
-                        issues.append(f"{year}/{county}: Invalid tract format: {tract}")
-    
-    if issues:
-        print("Potential issues found:")
-        for issue in issues[:20]:
-            print(f"  ⚠ {issue}")
-        if len(issues) > 20:
-            print(f"  ... and {len(issues) - 20} more")
-    else:
-        print("✓ No anomalies detected")
-    
-    print()
+    acc = AnomalyAcc()
+    for year, year_data in data.items():
+        acc.update(year, year_data)
+    acc.finalize()
 
 
-def consistency_check(data: dict):
-    """Check data consistency across years."""
-    print(f"\n{'='*60}")
-    print("Consistency Analysis")
-    print(f"{'='*60}\n")
-    
-    # Track tract appearances
-    tract_years = defaultdict(lambda: defaultdict(set))
-    
-    for year in data:
-        for county, tracts in data[year].items():
-            if isinstance(tracts, list):
-                for tract in tracts:
-                    tract_years[county][tract].add(year)
-    
-    # Find tracts that appear/disappear erratically
-    years = sorted(data.keys())
-    erratic = []
-    
-    for county, tract_data in tract_years.items():
-        for tract, appeared_years in tract_data.items():
+def _compare_pair(data: dict, pair: tuple) -> str:
+    """Run one year comparison with stdout captured, for the process pool.
+
+    Each worker builds its own pair's sets: pickling parent-built sets
+    perturbs their iteration order, which would change the sampled tracts
+    in the report.
+    """
+    year1, year2 = pair
+    buf = io.StringIO()
+    with redirect_stdout(buf):
+        year_over_year_comparison(data, year1, year2)
+    return buf.getvalue()
+
+
+class ConsistencyAcc:
+    """Accumulates tract appearance history; finalize prints gap findings."""
+
+    def __init__(self):
+        # A single (county, tract)-keyed dict does one hash per insert
+        # instead of two nested defaultdict lookups
+        self.tract_years = defaultdict(set)
+        self.seen_years = set()
+
+    def update(self, year, year_data):
+        self.seen_years.add(year)
+        for county, tracts in year_data.items():
+            for tract in tracts:
+                self.tract_years[(county, tract)].add(year)
+
+    def finalize(self, years: tuple | None = None):
+        out = [f"\n{'='*60}", "Consistency Analysis", f"{'='*60}\n"]
+
+        # Find tracts that appear/disappear erratically
+        if years is None:
+            years = tuple(sorted(self.seen_years))
+        year_idx = {y: i for i, y in enumerate(years)}
+        erratic = []
+
+        for (county, tract), appeared_years in self.tract_years.items():
             appeared = sorted(appeared_years)
             # Check if there are gaps (appeared, disappeared, reappeared)
             if len(appeared) >= 2:
-                year_indices = [years.index(y) for y in appeared]
-                for i in range(len(year_indices) - 1):
-                    if year_indices[i+1] - year_indices[i] > 1:
-                        # There's a gap
-                        erratic.append((county, tract, appeared))
-                        break
-    
-    if erratic:
-        print(f"Tracts with gaps (appeared, disappeared, reappeared): {len(erratic)}")
-        for county, tract, appeared in erratic[:10]:
-            print(f"  {county} / {tract}: appeared in {appeared}")
-        if len(erratic) > 10:
-            print(f"  ... and {len(erratic) - 10} more")
-    else:
-        print("✓ No erratic appearances detected")
-    
-    print()
+                # O(1) dict lookups instead of years.index() linear scans;
+                # any() short-circuits the pairwise gap scan in C
+                year_indices = [year_idx[y] for y in appeared]
+                if any(b - a > 1 for a, b in zip(year_indices, year_indices[1:])):
+                    erratic.append((county, tract, appeared))
+
+        if erratic:
+            out.append(f"Tracts with gaps (appeared, disappeared, reappeared): {len(erratic)}")
+            for county, tract, appeared in erratic[:10]:
+                out.append(f"  {county} / {tract}: appeared in {appeared}")
+            if len(erratic) > 10:
+                out.append(f"  ... and {len(erratic) - 10} more")
+        else:
+            out.append("✓ No erratic appearances detected")
+
+        out.append("")
+        sys.stdout.write("\n".join(out) + "\n")
+
+
+def consistency_check(data: dict, years: tuple | None = None):
+    """Check data consistency across years."""
+    acc = ConsistencyAcc()
+    for year, year_data in data.items():
+        acc.update(year, year_data)
+    acc.finalize(years)
 
 
 def main():
@@ -281,18 +434,16 @@ def main():
     args = parser.parse_args()
     
     if args.command == "summary":
-        if args.zone_type == "ldct":
-            data = load_ldct_combined(args.extracted_dir)
-        else:
-            data = load_mz_combined(args.extracted_dir)
-        summary_stats(data, args.zone_type)
+        # Single-pass command: stream years instead of loading the dict
+        combined_file = args.extracted_dir / f"{args.zone_type}_combined.json"
+        summary_stats(iter_years(combined_file), args.zone_type)
     
     elif args.command == "compare":
         if args.type == "ldct":
             data = load_ldct_combined(args.extracted_dir)
         else:
             data = load_mz_combined(args.extracted_dir)
-        year_over_year_comparison(data, args.year1, args.year2, args.type)
+        year_over_year_comparison(data, args.year1, args.year2)
     
     elif args.command == "spot-check":
         if args.type == "ldct":
@@ -302,19 +453,37 @@ def main():
         spot_check_county(data, args.county)
     
     elif args.command == "full":
-        if args.zone_type == "ldct":
-            data = load_ldct_combined(args.extracted_dir)
-        else:
-            data = load_mz_combined(args.extracted_dir)
-        
-        summary_stats(data, args.zone_type)
-        find_anomalies(data)
-        consistency_check(data)
-        
-        # Compare consecutive years
-        years = sorted(data.keys())
-        for i in range(len(years) - 1):
-            year_over_year_comparison(data, years[i], years[i+1], args.zone_type)
+        combined_file = args.extracted_dir / f"{args.zone_type}_combined.json"
+
+        # One streamed pass over the combined file feeds every
+        # accumulator and retains the per-year data the comparisons below
+        # need, instead of a separate full-data walk per check
+        accs = (StatsAcc(args.zone_type), AnomalyAcc(), ConsistencyAcc())
+        data = {}
+        for year, year_data in iter_years(combined_file):
+            if args.zone_type == "mz":
+                year_data = _normalize_mz_year(year_data)
+            else:
+                year_data = _intern_year(year_data)
+            data[year] = year_data
+            for acc in accs:
+                acc.update(year, year_data)
+
+        # Sort the year keys once for every check below
+        years = tuple(sorted(data))
+
+        stats_acc, anomaly_acc, consistency_acc = accs
+        stats_acc.finalize()
+        anomaly_acc.finalize()
+        consistency_acc.finalize(years)
+
+        # Compare consecutive years. The pairs are independent, so run
+        # them across a process pool (same pattern as the extraction CLI)
+        # and print the captured output in year order.
+        with ProcessPoolExecutor() as ex:
+            compare = partial(_compare_pair, data)
+            for text in ex.map(compare, zip(years, years[1:])):
+                sys.stdout.write(text)
     
     else:
         parser.print_help()